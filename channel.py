@@ -1,8 +1,7 @@
 import asyncio
 import math
 import random
-import time
-from typing import Dict, Any, Optional
+from typing import Dict, Any, List, Optional, Set, Tuple
 
 
 class WirelessChannel:
@@ -11,25 +10,82 @@ class WirelessChannel:
 
     Simplified MAC (CSMA/CA-style):
     - channel_busy_until: when the medium becomes free.
-    - medium_lock: ensures only one transmitter reserves the channel at a time.
+    - _medium_free: event that is set while the medium is idle, so senders
+      sleep until the current TX ends instead of polling every slot.
+    - reservation is check-then-set with no await in between, so on the single
+      event loop only one transmitter can win the medium; no lock is needed.
     - Before each TX, nodes:
         * sense if channel is busy,
         * wait if needed,
         * apply random backoff,
         * then transmit.
+
+    Spatial index:
+    - node positions are mirrored into flat per-axis lists (_xs/_ys, by nid),
+    - nodes are bucketed into a uniform grid of comm_range-sized cells,
+      so a broadcast only has to look at the sender's cell and its 8 neighbors.
     """
 
     def __init__(self, comm_range: float, cfg: Dict[str, Any]):
         self.comm_range = comm_range
         self.cfg = cfg
         self.nodes: Dict[int, Any] = {}
+        # Channel-owned PRNG for backoff and jitter (nodes use seed + nid, 0..num_nodes-1)
+        self._rng = random.Random(cfg["seed"] + cfg["num_nodes"])
+
+        # Structure-of-arrays copy of node positions, indexed by nid
+        self._xs: List[float] = []
+        self._ys: List[float] = []
+        self._comm_range_sq = comm_range * comm_range
+
+        # Per-hop delay constants (multiply by 1/c instead of dividing per receiver)
+        self._inv_prop = 1.0 / cfg["prop_speed_mps"]
+        self._max_hop = cfg["max_per_hop_delay_s"]
+        self._base_delay = cfg["channel_base_delay_s"]
+        self._jitter_lo, self._jitter_hi = cfg["channel_jitter_s"]
+
+        # MAC timing, hoisted out of the per-TX path
+        self._tx_dur = cfg["mac_tx_duration_s"]
+        self._min_backoff = cfg["mac_min_backoff_s"]
+        self._max_backoff = cfg["mac_max_backoff_s"]
+
+        # Uniform grid: (cell_x, cell_y) -> node ids in that cell
+        self.cell_size = comm_range
+        self._grid: Dict[Tuple[int, int], Set[int]] = {}
 
         # MAC state
-        self.medium_lock = asyncio.Lock()
         self.channel_busy_until: float = 0.0
+        self._medium_free = asyncio.Event()
+        self._medium_free.set()
 
     def attach(self, node: Any):
-        self.nodes[node.nid] = node
+        nid = node.nid
+        self.nodes[nid] = node
+        while len(self._xs) <= nid:
+            self._xs.append(0.0)
+            self._ys.append(0.0)
+        x, y = node.pos[0], node.pos[1]
+        self._xs[nid] = x
+        self._ys[nid] = y
+        self._grid.setdefault(self._cell(x, y), set()).add(nid)
+
+    def _cell(self, x: float, y: float) -> Tuple[int, int]:
+        return (int(x / self.cell_size), int(y / self.cell_size))
+
+    def set_pos(self, nid: int, x: float, y: float):
+        """Record a node's new position; move it between grid cells if needed."""
+        old_cell = self._cell(self._xs[nid], self._ys[nid])
+        self._xs[nid] = x
+        self._ys[nid] = y
+        new_cell = self._cell(x, y)
+        if old_cell == new_cell:
+            return
+        cell = self._grid.get(old_cell)
+        if cell is not None:
+            cell.discard(nid)
+            if not cell:
+                del self._grid[old_cell]
+        self._grid.setdefault(new_cell, set()).add(nid)
 
     # ---------- MAC core: CSMA/CA-like behavior ----------
 
@@ -38,22 +94,15 @@ class WirelessChannel:
         Wait until the channel appears idle, then perform random backoff.
         This is a simplified CSMA/CA without exponential window or RTS/CTS.
         """
-        slot = self.cfg.get("mac_slot_s", 0.001)
         while True:
-            now = time.time()
-            if now >= self.channel_busy_until:
-                # Channel looks idle → random backoff
-                backoff = random.uniform(
-                    self.cfg["mac_min_backoff_s"],
-                    self.cfg["mac_max_backoff_s"],
-                )
-                await asyncio.sleep(backoff)
-                # After backoff, check again
-                if time.time() >= self.channel_busy_until:
-                    return
-            else:
-                # Channel busy, wait a bit and sense again
-                await asyncio.sleep(slot)
+            # Sleep until the medium is released (no-op if already idle)
+            await self._medium_free.wait()
+            # Channel looks idle → random backoff
+            backoff = self._rng.uniform(self._min_backoff, self._max_backoff)
+            await asyncio.sleep(backoff)
+            # After backoff, check again
+            if self._medium_free.is_set():
+                return
 
     async def _mac_send(self, sender_id: int, msg: Any, *, is_broadcast: bool, next_hop_id: Optional[int] = None):
         """
@@ -64,54 +113,72 @@ class WirelessChannel:
         """
         while True:
             await self._wait_for_idle_and_backoff()
-            async with self.medium_lock:
-                now = time.time()
-                if now < self.channel_busy_until:
-                    # Lost the race; someone else reserved medium → retry
-                    continue
+            # No await from here on: check + reserve is atomic on the event loop
+            loop = asyncio.get_running_loop()
+            now = loop.time()
+            if now < self.channel_busy_until:
+                # Lost the race; someone else reserved medium → retry
+                continue
 
-                # Reserve medium for the TX duration
-                tx_dur = self.cfg["mac_tx_duration_s"]
-                self.channel_busy_until = now + tx_dur
+            # Reserve medium for the TX duration
+            tx_dur = self._tx_dur
+            self.channel_busy_until = now + tx_dur
+            self._medium_free.clear()
+            loop.call_later(tx_dur, self._medium_free.set)
 
-                # Perform the actual wireless delivery (non-blocking on medium)
-                if is_broadcast:
-                    await self._raw_broadcast(sender_id, msg)
-                else:
-                    if next_hop_id is not None:
-                        await self._raw_unicast(sender_id, next_hop_id, msg)
-                return  # transmission done
+            # Perform the actual wireless delivery (non-blocking on medium)
+            if is_broadcast:
+                self._raw_broadcast(sender_id, msg)
+            else:
+                if next_hop_id is not None:
+                    self._raw_unicast(sender_id, next_hop_id, msg)
+            return  # transmission done
 
     # ---------- Physical behaviors (now called from _mac_send) ----------
-
-    async def _raw_broadcast(self, sender_id: int, msg: Any):
-        sender = self.nodes[sender_id]
-        sx, sy, sz = sender.pos
-        tasks = []
-        for nid, node in self.nodes.items():
-            if nid == sender_id:
-                continue
-            dist = math.dist((sx, sy, sz), node.pos)
-            if dist <= self.comm_range:
-                jitter = random.uniform(*self.cfg["channel_jitter_s"])
-                dist_delay = min(dist / self.cfg["prop_speed_mps"], self.cfg["max_per_hop_delay_s"])
-                delay = self.cfg["channel_base_delay_s"] + jitter + dist_delay
-                tasks.append(asyncio.create_task(self._deliver_with_delay(node, msg, delay)))
-        if tasks:
-            await asyncio.gather(*tasks)
-
-    async def _raw_unicast(self, sender_id: int, next_hop_id: int, msg: Any):
-        sender = self.nodes[sender_id]
-        if next_hop_id not in self.nodes:
+    # Deliveries are scheduled with loop.call_later straight into the
+    # receiver's mailbox (fire-and-forget, like real radio), so no Task or
+    # coroutine is created per recipient.
+
+    def _raw_broadcast(self, sender_id: int, msg: Any):
+        xs, ys = self._xs, self._ys
+        range_sq = self._comm_range_sq
+        sx, sy = xs[sender_id], ys[sender_id]
+        cx, cy = self._cell(sx, sy)
+        loop = asyncio.get_running_loop()
+        for gx in (cx - 1, cx, cx + 1):
+            for gy in (cy - 1, cy, cy + 1):
+                cell = self._grid.get((gx, gy))
+                if not cell:
+                    continue
+                for nid in cell:
+                    if nid == sender_id:
+                        continue
+                    dx = xs[nid] - sx
+                    dy = ys[nid] - sy
+                    d2 = dx * dx + dy * dy
+                    if d2 > range_sq:
+                        continue
+                    node = self.nodes[nid]
+                    dist = math.sqrt(d2)
+                    jitter = self._rng.uniform(self._jitter_lo, self._jitter_hi)
+                    dist_delay = min(dist * self._inv_prop, self._max_hop)
+                    delay = self._base_delay + jitter + dist_delay
+                    loop.call_later(delay, node.deliver, msg)
+
+    def _raw_unicast(self, sender_id: int, next_hop_id: int, msg: Any):
+        rx = self.nodes.get(next_hop_id)
+        if rx is None:
             return
-        rx = self.nodes[next_hop_id]
-        dist = math.dist(sender.pos, rx.pos)
-        if dist > self.comm_range:
+        dx = self._xs[next_hop_id] - self._xs[sender_id]
+        dy = self._ys[next_hop_id] - self._ys[sender_id]
+        d2 = dx * dx + dy * dy
+        if d2 > self._comm_range_sq:
             return
-        jitter = random.uniform(*self.cfg["channel_jitter_s"])
-        dist_delay = min(dist / self.cfg["prop_speed_mps"], self.cfg["max_per_hop_delay_s"])
-        delay = self.cfg["channel_base_delay_s"] + jitter + dist_delay
-        await self._deliver_with_delay(rx, msg, delay)
+        dist = math.sqrt(d2)
+        jitter = self._rng.uniform(self._jitter_lo, self._jitter_hi)
+        dist_delay = min(dist * self._inv_prop, self._max_hop)
+        delay = self._base_delay + jitter + dist_delay
+        asyncio.get_running_loop().call_later(delay, rx.deliver, msg)
 
     # ---------- Public API: broadcast/unicast with MAC ----------
 
@@ -120,7 +187,3 @@ class WirelessChannel:
 
     async def unicast(self, sender_id: int, next_hop_id: int, msg: Any):
         await self._mac_send(sender_id, msg, is_broadcast=False, next_hop_id=next_hop_id)
-
-    async def _deliver_with_delay(self, node: Any, msg: Any, delay: float):
-        await asyncio.sleep(delay)
-        await node.inbox.put(msg)
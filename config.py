@@ -6,7 +6,8 @@ SIM_CONFIG = {
     "world_size": (1000.0, 700.0),    # meters (X, Y)
     "comm_range": 260.0,              # meters radio range (approx. Wi-Fi / ISM range)
     "hello_period_s": 0.6,            # neighbor beacons
-    "dv_period_s": 1.2,               # routing periodic updates
+    "dv_period_s": 1.2,               # routing update check (triggered, changed rows only)
+    "dv_heartbeat_s": 6.0,            # full-vector DV refresh even without changes
     "mobility_step_s": 0.20,          # mobility tick
     "app_send_period_s": 1.6,         # handshake initiation period
     "sim_time_s": 140.0,              # total simulation time
@@ -23,7 +24,6 @@ SIM_CONFIG = {
     # Simplified MAC parameters (CSMA/CA-style)
     "mac_min_backoff_s": 0.001,
     "mac_max_backoff_s": 0.006,
-    "mac_slot_s": 0.001,              # sensing slot time
     "mac_tx_duration_s": 0.003,       # on-air duration for a frame
     # Neighbor aging (to make DV react to mobility)
     "neighbor_timeout_s": 2.0,        # time w/o Hello before a neighbor is considered gone
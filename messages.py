@@ -1,34 +1,33 @@
-from dataclasses import dataclass, field
-from typing import Tuple, Dict, List
-import random
+from dataclasses import dataclass
+from typing import Tuple
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class HelloMsg:
     src: int
     pos: Tuple[float, float, float]
     seq: int
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class DVMsg:
     src: int
-    vector: Dict[int, Tuple[float, int]]  # dest -> (cost, next_hop_from_src)
+    vector: Tuple[Tuple[int, float, int], ...]  # (dest, cost, next_hop_from_src) rows
     seq: int
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class SessionReq:
     """Handshake request from initiator (src) to target (dst)."""
     src: int
     dst: int
     session_id: int
     created_at: float
-    path: List[int] = field(default_factory=list)
+    path: Tuple[int, ...] = ()
     hop_count: int = 0
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class SessionAck:
     """Handshake ack from target back to initiator."""
     src: int           # target (responder)
@@ -36,17 +35,17 @@ class SessionAck:
     session_id: int
     target: int        # explicit target ID (same as src at creation)
     created_at: float
-    path: List[int] = field(default_factory=list)
+    path: Tuple[int, ...] = ()
     hop_count: int = 0
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class DataMsg:
     """Actual data packet, created only AFTER handshake succeeds."""
     src: int
     dst: int
     payload: bytes
     created_at: float
-    path: List[int] = field(default_factory=list)
+    id: int            # drawn from the sending node's RNG
+    path: Tuple[int, ...] = ()
     hop_count: int = 0
-    id: int = field(default_factory=lambda: random.randint(1, 10_000_000))
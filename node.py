@@ -1,8 +1,10 @@
 # node.py
 import asyncio
+import collections
 import math
 import random
 import time
+from dataclasses import replace
 from typing import Dict, Optional, Tuple, List, Set, Any
 
 from messages import HelloMsg, DVMsg, SessionReq, SessionAck, DataMsg
@@ -16,22 +18,46 @@ class DroneNode:
         self.cfg = cfg
         self.channel = channel
         self.world_size = world_size
+        # Per-node PRNG: no shared module-level state, reproducible per node
+        self._rng = random.Random(cfg["seed"] + nid)
 
-        x = random.uniform(0, world_size[0])
-        y = random.uniform(0, world_size[1])
+        x = self._rng.uniform(0, world_size[0])
+        y = self._rng.uniform(0, world_size[1])
         self.pos: Tuple[float, float, float] = (x, y, 0.0)
 
         self._target_wp: Optional[Tuple[float, float, float]] = None
         self._wp_pause_until: float = 0.0
-        self._speed = random.uniform(*cfg["speed_mps"])
-
-        self.inbox: asyncio.Queue = asyncio.Queue()
+        # Config hoisted out of hot paths
+        self._speed_range = cfg["speed_mps"]
+        self._pause_range = cfg["waypoint_pause_s"]
+        self._neighbor_timeout = cfg.get("neighbor_timeout_s", 3.0 * cfg["hello_period_s"])
+        self._log_dv = cfg["log_dv_changes"]
+        self._payload = cfg.get("_shared_payload") or bytes(cfg["data_payload_bytes"])
+
+        self._speed = self._rng.uniform(*self._speed_range)
+
+        # RX mailbox: frames are appended by the channel, drained in bursts by rx_loop
+        self._mailbox: collections.deque = collections.deque()
+        self._mailbox_ready = asyncio.Event()
         self.neighbors: Set[int] = set()
         # Track last time we heard from each neighbor (for aging)
         self.neighbor_last_seen: Dict[int, float] = {}
 
         # DV Routing table: dest -> Route(cost, next_hop, updated_at)
-        self.rt: Dict[int, Route] = {self.nid: Route(0.0, self.nid, time.time())}
+        # Timestamps use the event loop clock (time.monotonic here, before the loop runs)
+        self.rt: Dict[int, Route] = {self.nid: Route(0.0, self.nid, time.monotonic())}
+        # Bumped on every (cost, next_hop) change in rt; used to reuse the DV vector
+        self._rt_version = 0
+        self._dv_vector_cache: Tuple[Tuple[int, float, int], ...] = ()
+        self._dv_vector_version = -1
+        # Triggered DV: what we last advertised, and when the last full vector went out
+        self._dv_advertised: Dict[int, Tuple[float, int]] = {}
+        self._dv_sent_version = -1
+        # (advertised rows, rt version) computed by dv_update, committed once the DV is sent
+        self._dv_pending: Optional[Tuple[Dict[int, Tuple[float, int]], int]] = None
+        self._dv_full_due = True
+        self._dv_last_full = float("-inf")
+        self._dv_heartbeat = cfg.get("dv_heartbeat_s", 5.0 * cfg["dv_period_s"])
 
         # Sequence counters
         self._hello_seq = 0
@@ -40,25 +66,35 @@ class DroneNode:
         # Metrics (Data only)
         self.delivered: int = 0
         self.generated: int = 0
-        self.latencies: List[float] = []
-        self.hops_used: List[int] = []
+        # Running sums over all deliveries (count == delivered)
+        self.latency_total: float = 0.0
+        self.hops_total: int = 0
 
         # Trace sink (assigned by viz)
         self._trace_sink = None
 
+        # RX dispatch: exact message type -> handler
+        self._handlers = {
+            HelloMsg: self._rx_hello,
+            DVMsg: self._rx_dv,
+            SessionReq: self._forward_session_req,
+            SessionAck: self._forward_session_ack,
+            DataMsg: self._forward_data,
+        }
+
     # -------- Mobility --------
 
     def _pick_new_waypoint(self):
-        tx = random.uniform(0, self.world_size[0])
-        ty = random.uniform(0, self.world_size[1])
+        tx = self._rng.uniform(0, self.world_size[0])
+        ty = self._rng.uniform(0, self.world_size[1])
         tz = 0.0
         self._target_wp = (tx, ty, tz)
-        self._speed = random.uniform(*self.cfg["speed_mps"])
-        pause = random.uniform(*self.cfg["waypoint_pause_s"])
-        self._wp_pause_until = time.time() + pause
+        self._speed = self._rng.uniform(*self._speed_range)
+        pause = self._rng.uniform(*self._pause_range)
+        self._wp_pause_until = asyncio.get_running_loop().time() + pause
 
     def _step_toward_waypoint(self, dt: float):
-        if self._target_wp is None or time.time() < self._wp_pause_until:
+        if self._target_wp is None or asyncio.get_running_loop().time() < self._wp_pause_until:
             return
         tx, ty, tz = self._target_wp
         x, y, z = self.pos
@@ -74,6 +110,8 @@ class DroneNode:
         else:
             r = step / dist
             self.pos = (x + r * dx, y + r * dy, 0.0)
+        # Keep the channel's position arrays / spatial grid in sync
+        self.channel.set_pos(self.nid, self.pos[0], self.pos[1])
 
     async def mobility_task(self):
         self._pick_new_waypoint()
@@ -84,54 +122,81 @@ class DroneNode:
 
     # -------- Neighbor Discovery & DV --------
 
-    async def hello_task(self):
-        period = self.cfg["hello_period_s"]
-        while True:
-            self._hello_seq += 1
-            await self.channel.broadcast(self.nid, HelloMsg(self.nid, self.pos, self._hello_seq))
-            await asyncio.sleep(period)
+    # Periodic beacons and aging are driven by Simulation._beacon_loop,
+    # which calls these for every node from a single timer.
 
-    async def dv_task(self):
-        period = self.cfg["dv_period_s"]
-        while True:
-            self._dv_seq += 1
-            vector = {dest: (route.cost, route.next_hop) for dest, route in self.rt.items()}
-            await self.channel.broadcast(self.nid, DVMsg(self.nid, vector, self._dv_seq))
-            await asyncio.sleep(period)
+    async def emit_hello(self):
+        self._hello_seq += 1
+        await self.channel.broadcast(self.nid, HelloMsg(self.nid, self.pos, self._hello_seq))
+
+    async def emit_dv(self, rows: Tuple[Tuple[int, float, int], ...]):
+        self._dv_seq += 1
+        await self.channel.broadcast(self.nid, DVMsg(self.nid, rows, self._dv_seq))
+        # Rows count as advertised only once the broadcast has won the medium
+        self._commit_dv()
+
+    def dv_update(self, now: float) -> Optional[Tuple[Tuple[int, float, int], ...]]:
+        """
+        Rows to advertise in this DV round, or None if there is nothing to send.
+        The full vector goes out on the heartbeat or after a new neighbor shows up;
+        otherwise only rows whose (cost, next_hop) changed since the last DV.
+        The rows are recorded as advertised when emit_dv has sent them, so call
+        this only when no DV of this node is still waiting for the medium.
+        """
+        full = self._dv_vector()
+        if self._dv_full_due or now - self._dv_last_full >= self._dv_heartbeat:
+            self._dv_full_due = False
+            self._dv_last_full = now
+            rows = full
+        elif self._dv_sent_version == self._rt_version:
+            return None
+        else:
+            sent = self._dv_advertised
+            rows = tuple(row for row in full if sent.get(row[0]) != (row[1], row[2]))
+        self._dv_pending = ({dest: (cost, nh) for dest, cost, nh in full}, self._rt_version)
+        if not rows:
+            self._commit_dv()
+            return None
+        return rows
+
+    def _commit_dv(self):
+        if self._dv_pending is not None:
+            self._dv_advertised, self._dv_sent_version = self._dv_pending
+            self._dv_pending = None
+
+    def _dv_vector(self) -> Tuple[Tuple[int, float, int], ...]:
+        """
+        Current DV vector; rebuilt only when rt changed since the last call.
+        The same immutable tuple is shared by every recipient.
+        """
+        if self._dv_vector_version != self._rt_version:
+            self._dv_vector_cache = tuple((dest, r.cost, r.next_hop) for dest, r in self.rt.items())
+            self._dv_vector_version = self._rt_version
+        return self._dv_vector_cache
 
-    async def neighbor_watch_task(self):
+    def age_neighbors(self, now: float):
         """
-        Periodically remove neighbors (and dependent routes) that have
+        Remove neighbors (and dependent routes) that have
         not been heard from for neighbor_timeout_s seconds.
         This makes DV routing react to mobility changes.
         """
-        hello_period = self.cfg["hello_period_s"]
-        timeout = self.cfg.get("neighbor_timeout_s", 3.0 * hello_period)
-        check_period = timeout / 3.0
-
-        while True:
-            now = time.time()
-            dead_neighbors = [
-                nid for nid, last in list(self.neighbor_last_seen.items())
-                if now - last > timeout
-            ]
-
-            if dead_neighbors:
-                for nid in dead_neighbors:
-                    self.neighbors.discard(nid)
-                    self.neighbor_last_seen.pop(nid, None)
-
-                # Remove direct 1-hop routes to dead neighbors
-                for dead in dead_neighbors:
-                    if dead in self.rt and self.rt[dead].next_hop == dead:
-                        del self.rt[dead]
+        timeout = self._neighbor_timeout
+        dead_set = {
+            nid for nid, last in self.neighbor_last_seen.items()
+            if now - last > timeout
+        }
 
-                # Remove any route whose next_hop is a dead neighbor
-                for dest in list(self.rt.keys()):
-                    if self.rt[dest].next_hop in dead_neighbors:
-                        del self.rt[dest]
+        if dead_set:
+            for nid in dead_set:
+                self.neighbors.discard(nid)
+                del self.neighbor_last_seen[nid]
 
-            await asyncio.sleep(check_period)
+            # Drop every route whose next_hop is a dead neighbor
+            # (this includes the direct 1-hop routes to them) in one pass
+            kept = {d: r for d, r in self.rt.items() if r.next_hop not in dead_set}
+            if len(kept) != len(self.rt):
+                self.rt = kept
+                self._rt_version += 1
 
     # -------- Handshake: SessionReq / SessionAck --------
 
@@ -143,29 +208,29 @@ class DroneNode:
         - DataMsg is only created after SessionAck reaches this node.
         """
         period = self.cfg["app_send_period_s"]
+        pairs = self.cfg["app_pairs_per_period"]
         while True:
-            for _ in range(self.cfg["app_pairs_per_period"]):
-                dst = random.choice(all_ids)
+            for _ in range(pairs):
+                dst = self._rng.choice(all_ids)
                 if dst == self.nid:
                     continue
                 # Only initiate if we currently have a route (approx "reachable")
                 if dst not in self.rt:
                     continue
-                session_id = random.randint(1, 10_000_000)
+                session_id = self._rng.randint(1, 10_000_000)
                 req = SessionReq(
                     src=self.nid,
                     dst=dst,
                     session_id=session_id,
-                    created_at=time.time(),
-                    path=[self.nid],
+                    created_at=asyncio.get_running_loop().time(),
+                    path=(self.nid,),
                     hop_count=0,
                 )
                 await self._forward_session_req(req)
             await asyncio.sleep(period)
 
     async def _forward_session_req(self, msg: SessionReq):
-        if not msg.path or msg.path[-1] != self.nid:
-            msg.path.append(self.nid)
+        path = msg.path if msg.path and msg.path[-1] == self.nid else msg.path + (self.nid,)
 
         if msg.dst == self.nid:
             # We are the target → create SessionAck
@@ -174,8 +239,8 @@ class DroneNode:
                 dst=msg.src,
                 session_id=msg.session_id,
                 target=self.nid,
-                created_at=time.time(),
-                path=[self.nid],
+                created_at=asyncio.get_running_loop().time(),
+                path=(self.nid,),
                 hop_count=0,
             )
             await self._forward_session_ack(ack)
@@ -184,30 +249,25 @@ class DroneNode:
         route = self.rt.get(msg.dst)
         if route is None:
             return
-        msg.hop_count += 1
-        await self.channel.unicast(self.nid, route.next_hop, msg)
+        await self.channel.unicast(
+            self.nid, route.next_hop, replace(msg, path=path, hop_count=msg.hop_count + 1)
+        )
 
     async def _forward_session_ack(self, msg: SessionAck):
-        if not msg.path or msg.path[-1] != self.nid:
-            msg.path.append(self.nid)
+        path = msg.path if msg.path and msg.path[-1] == self.nid else msg.path + (self.nid,)
 
         if msg.dst == self.nid:
             # Handshake complete at initiator → create DataMsg
             target = msg.target
             if target not in self.rt:
                 return
-            if hasattr(random, "randbytes"):
-                payload = random.randbytes(self.cfg["data_payload_bytes"])
-            else:
-                payload = bytes(
-                    [random.randint(0, 255) for _ in range(self.cfg["data_payload_bytes"])]
-                )
             data = DataMsg(
                 src=self.nid,
                 dst=target,
-                payload=payload,
-                created_at=time.time(),
-                path=[self.nid],
+                payload=self._payload,
+                created_at=asyncio.get_running_loop().time(),
+                id=self._rng.randint(1, 10_000_000),
+                path=(self.nid,),
                 hop_count=0,
             )
             self.generated += 1
@@ -217,51 +277,70 @@ class DroneNode:
         route = self.rt.get(msg.dst)
         if route is None:
             return
-        msg.hop_count += 1
-        await self.channel.unicast(self.nid, route.next_hop, msg)
+        await self.channel.unicast(
+            self.nid, route.next_hop, replace(msg, path=path, hop_count=msg.hop_count + 1)
+        )
 
     # -------- Data Plane (after handshake) --------
 
     async def _forward_data(self, msg: DataMsg):
-        if not msg.path or msg.path[-1] != self.nid:
-            msg.path.append(self.nid)
+        path = msg.path if msg.path and msg.path[-1] == self.nid else msg.path + (self.nid,)
 
         if msg.dst == self.nid:
             self.delivered += 1
-            latency = time.time() - msg.created_at
-            self.latencies.append(latency)
-            self.hops_used.append(msg.hop_count)
+            latency = asyncio.get_running_loop().time() - msg.created_at
+            self.latency_total += latency
+            self.hops_total += msg.hop_count
             if self._trace_sink is not None:
-                self._trace_sink(msg.path[:])
+                self._trace_sink(path)
             return
 
         route = self.rt.get(msg.dst)
         if route is None:
             return
-        msg.hop_count += 1
-        await self.channel.unicast(self.nid, route.next_hop, msg)
+        await self.channel.unicast(
+            self.nid, route.next_hop, replace(msg, path=path, hop_count=msg.hop_count + 1)
+        )
 
     # -------- RX Loop --------
 
+    def _rx_hello(self, m: HelloMsg):
+        if m.src not in self.neighbors:
+            # A new neighbor needs our whole table, not just the next delta
+            self._dv_full_due = True
+        self.neighbors.add(m.src)
+        now = asyncio.get_running_loop().time()
+        self.neighbor_last_seen[m.src] = now
+        if ensure_one_hop(self.rt, m.src, now=now, log=self._log_dv):
+            self._rt_version += 1
+
+    def _rx_dv(self, m: DVMsg):
+        now = asyncio.get_running_loop().time()
+        if apply_distance_vector(self.rt, self.nid, m.src, m.vector, now=now, log=self._log_dv):
+            self._rt_version += 1
+
+    def deliver(self, msg: Any):
+        """Called by the channel when a frame arrives (never blocks)."""
+        self._mailbox.append(msg)
+        self._mailbox_ready.set()
+
     async def rx_loop(self):
+        handlers = self._handlers
+        mailbox = self._mailbox
+        ready = self._mailbox_ready
         while True:
-            m = await self.inbox.get()
-            if isinstance(m, HelloMsg):
-                self.neighbors.add(m.src)
-                self.neighbor_last_seen[m.src] = time.time()
-                ensure_one_hop(self.rt, m.src, log=self.cfg["log_dv_changes"])
-
-            elif isinstance(m, DVMsg):
-                apply_distance_vector(self.rt, self.nid, m.src, m.vector, log=self.cfg["log_dv_changes"])
-
-            elif isinstance(m, SessionReq):
-                await self._forward_session_req(m)
-
-            elif isinstance(m, SessionAck):
-                await self._forward_session_ack(m)
-
-            elif isinstance(m, DataMsg):
-                await self._forward_data(m)
+            await ready.wait()
+            # Drain everything that arrived, including frames delivered while
+            # a handler was awaiting; clear only once the mailbox is empty.
+            while mailbox:
+                m = mailbox.popleft()
+                handler = handlers.get(type(m))
+                if handler is None:
+                    continue
+                result = handler(m)
+                if asyncio.iscoroutine(result):
+                    await result
+            ready.clear()
 
     # -------- Summary --------
 
@@ -271,8 +350,8 @@ class DroneNode:
             "generated": self.generated,
             "delivered": self.delivered,
             "delivery_ratio": (self.delivered / self.generated) if self.generated else 0.0,
-            "avg_latency_s": (sum(self.latencies) / len(self.latencies)) if self.latencies else None,
-            "avg_hops": (sum(self.hops_used) / len(self.hops_used)) if self.hops_used else None,
+            "avg_latency_s": (self.latency_total / self.delivered) if self.delivered else None,
+            "avg_hops": (self.hops_total / self.delivered) if self.delivered else None,
             "neighbors_now": sorted(self.neighbors),
             "routes_now": {d: (r.next_hop, round(r.cost, 1)) for d, r in sorted(self.rt.items())},
         }
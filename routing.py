@@ -1,41 +1,61 @@
 from dataclasses import dataclass
 from typing import Dict, Tuple
-import time
 
 
-@dataclass
+@dataclass(slots=True)
 class Route:
     cost: float
     next_hop: int
     updated_at: float
 
 
-def ensure_one_hop(rt: Dict[int, Route], neighbor_id: int, *, log: bool = False):
-    now = time.time()
+def ensure_one_hop(rt: Dict[int, Route], neighbor_id: int, *, now: float, log: bool = False) -> bool:
+    """Install a direct route to neighbor_id. Returns True if rt changed."""
     old = rt.get(neighbor_id)
     if old is None or old.cost > 1.0:
         rt[neighbor_id] = Route(cost=1.0, next_hop=neighbor_id, updated_at=now)
         if log:
             print(f"[DV] New 1-hop route to {neighbor_id}")
+        return True
+    return False
 
 
 def apply_distance_vector(
     rt: Dict[int, Route],
     self_id: int,
     src: int,
-    their_vector: Dict[int, Tuple[float, int]],
+    their_vector: Tuple[Tuple[int, float, int], ...],
     *,
+    now: float,
     log: bool = False,
-):
-    """Bellman-Ford relaxation: cost_via_src = 1 + their_cost."""
-    ensure_one_hop(rt, src, log=log)
-    now = time.time()
-    for dest, (their_cost, _nh) in their_vector.items():
+) -> bool:
+    """
+    Bellman-Ford relaxation: cost_via_src = 1 + their_cost.
+    Returns True if any (cost, next_hop) entry in rt changed; routes via src
+    that are merely re-confirmed only get their updated_at refreshed.
+    Existing Route objects are relaxed in place; only new destinations allocate.
+    """
+    changed = ensure_one_hop(rt, src, now=now, log=log)
+    rt_get = rt.get
+    for dest, their_cost, _nh in their_vector:
         if dest == self_id:
             continue
         cost_via_src = 1.0 + their_cost
-        existing = rt.get(dest)
-        if existing is None or cost_via_src + 1e-9 < existing.cost or existing.next_hop == src:
+        existing = rt_get(dest)
+        if existing is None:
             rt[dest] = Route(cost=cost_via_src, next_hop=src, updated_at=now)
-            if log:
-                print(f"[DV] RT update: dest={dest} via {src}, cost={cost_via_src:.1f}")
+        elif existing.next_hop == src:
+            existing.updated_at = now
+            if existing.cost == cost_via_src:
+                continue
+            existing.cost = cost_via_src
+        elif cost_via_src + 1e-9 < existing.cost:
+            existing.cost = cost_via_src
+            existing.next_hop = src
+            existing.updated_at = now
+        else:
+            continue
+        changed = True
+        if log:
+            print(f"[DV] RT update: dest={dest} via {src}, cost={cost_via_src:.1f}")
+    return changed
@@ -1,6 +1,6 @@
 # sim.py
 import asyncio
-from typing import Dict, Any, List
+from typing import Dict, Any, List, Tuple
 
 from config import SIM_CONFIG
 from channel import WirelessChannel
@@ -13,10 +13,15 @@ class Simulation:
         self.channel = WirelessChannel(cfg["comm_range"], cfg)
         self.nodes: List[DroneNode] = []
         self.tasks: List[asyncio.Task] = []
+        # Latest Hello / DV broadcast task per node (at most one of each in flight)
+        self._hello_sends: Dict[int, asyncio.Task] = {}
+        self._dv_sends: Dict[int, asyncio.Task] = {}
         self._running = False
 
     def build(self):
         W, H = self.cfg["world_size"]
+        # Payload content is never inspected, so every DataMsg shares one immutable buffer
+        self.cfg["_shared_payload"] = bytes(self.cfg["data_payload_bytes"])
         for nid in range(self.cfg["num_nodes"]):
             node = DroneNode(
                 nid=nid,
@@ -33,28 +38,78 @@ class Simulation:
         all_ids = [n.nid for n in self.nodes]
         for n in self.nodes:
             self.tasks.append(asyncio.create_task(n.mobility_task()))
-            self.tasks.append(asyncio.create_task(n.hello_task()))
-            self.tasks.append(asyncio.create_task(n.dv_task()))
             self.tasks.append(asyncio.create_task(n.rx_loop()))
             self.tasks.append(asyncio.create_task(n.app_task(all_ids)))
-            self.tasks.append(asyncio.create_task(n.neighbor_watch_task()))
+        self.tasks.append(asyncio.create_task(self._beacon_loop()))
         await asyncio.sleep(self.cfg["sim_time_s"])
-        for t in self.tasks:
+        pending = [*self.tasks, *self._hello_sends.values(), *self._dv_sends.values()]
+        for t in pending:
             t.cancel()
-        await asyncio.gather(*self.tasks, return_exceptions=True)
+        await asyncio.gather(*pending, return_exceptions=True)
         self._running = False
 
+    async def _beacon_loop(self):
+        """
+        Single scheduler for every node's Hello beacons, DV updates and
+        neighbor aging, instead of three sleeping tasks per node.
+        The broadcasts of one round are started as tasks and contend for the MAC
+        concurrently; the scheduler does not wait for them, so neighbor aging and
+        the next deadlines are not delayed by a congested medium. A node whose
+        previous Hello (or DV) is still waiting for the medium skips that round,
+        so the backlog stays bounded at one send of each type per node.
+        """
+        hello_period = self.cfg["hello_period_s"]
+        dv_period = self.cfg["dv_period_s"]
+        timeout = self.cfg.get("neighbor_timeout_s", 3.0 * hello_period)
+        check_period = timeout / 3.0
+
+        loop = asyncio.get_running_loop()
+        now = loop.time()
+        next_hello = next_dv = now
+        next_watch = now + check_period
+        while True:
+            now = loop.time()
+            if now >= next_hello:
+                for n in self.nodes:
+                    if self._idle(self._hello_sends, n.nid):
+                        self._hello_sends[n.nid] = asyncio.create_task(n.emit_hello())
+                next_hello = now + hello_period
+            if now >= next_dv:
+                for n in self.nodes:
+                    if self._idle(self._dv_sends, n.nid):
+                        rows = n.dv_update(now)
+                        if rows is not None:
+                            self._dv_sends[n.nid] = asyncio.create_task(n.emit_dv(rows))
+                next_dv = now + dv_period
+            if now >= next_watch:
+                for n in self.nodes:
+                    n.age_neighbors(now)
+                next_watch = now + check_period
+            await asyncio.sleep(max(0.0, min(next_hello, next_dv, next_watch) - loop.time()))
+
+    @staticmethod
+    def _idle(sends: Dict[int, asyncio.Task], nid: int) -> bool:
+        """True if node nid has no broadcast of this type still in flight."""
+        task = sends.get(nid)
+        return task is None or task.done()
+
+    def totals(self) -> Tuple[int, int, int, float]:
+        """(generated, delivered, hop sum, latency sum) from the nodes' running counters."""
+        nodes = self.nodes
+        return (
+            sum(n.generated for n in nodes),
+            sum(n.delivered for n in nodes),
+            sum(n.hops_total for n in nodes),
+            sum(n.latency_total for n in nodes),
+        )
+
     def report(self):
-        tot_gen = sum(n.generated for n in self.nodes)
-        tot_del = sum(n.delivered for n in self.nodes)
-        all_lat = [lat for n in self.nodes for lat in n.latencies]
-        all_hops = [h for n in self.nodes for h in n.hops_used]
+        tot_gen, tot_del, hop_sum, lat_sum = self.totals()
         print("\n=== Simulation Summary ===")
         print(f"Nodes: {len(self.nodes)}  Range: {self.cfg['comm_range']} m  Duration: {self.cfg['sim_time_s']} s")
         print(f"Total generated (Data): {tot_gen}  Total delivered: {tot_del}")
         dr = (tot_del / tot_gen) if tot_gen else 0.0
         print(f"Delivery ratio: {dr:.3f}")
-        if all_lat:
-            print(f"Avg latency: {sum(all_lat)/len(all_lat):.4f} s")
-        if all_hops:
-            print(f"Avg hops: {sum(all_hops)/len(all_hops):.3f}")
+        if tot_del:
+            print(f"Avg latency: {lat_sum/tot_del:.4f} s")
+            print(f"Avg hops: {hop_sum/tot_del:.3f}")
@@ -1,59 +1,158 @@
 import asyncio
-import math
 import threading
 import time
-from collections import deque
 from typing import List, Tuple, Dict, Optional, Any
 
+import numpy as np
 import matplotlib.pyplot as plt
 from matplotlib.animation import FuncAnimation
 from matplotlib.collections import LineCollection
-from matplotlib import cm, colors as mcolors
+from matplotlib import cm
 from matplotlib.widgets import Button
 
 from config import SIM_CONFIG
 from sim import Simulation
 
+try:  # optional: only used for the link scan on large swarms
+    from numba import njit, prange
+except ImportError:
+    njit = None
+
+# Node count from which the Numba link kernel replaces the NumPy upper-triangle scan
+NUMBA_MIN_NODES = 200
+
+if njit is not None:
+    @njit(cache=True, parallel=True, boundscheck=False)
+    def _edge_kernel(pos, comm_range_sq, out_segs, out_dists):
+        """
+        Write in-range pairs (i < j, row-major like np.triu_indices) of an (N, 2)
+        position array into preallocated out_segs (M_max, 2, 2) / out_dists (M_max,)
+        and return the pair count M. Rows are counted, then filled, in parallel;
+        both passes must evaluate the range test identically, hence no fastmath.
+        """
+        n = pos.shape[0]
+        counts = np.zeros(n + 1, dtype=np.int64)
+        for i in prange(n):
+            c = 0
+            for j in range(i + 1, n):
+                dx = pos[i, 0] - pos[j, 0]
+                dy = pos[i, 1] - pos[j, 1]
+                if dx * dx + dy * dy <= comm_range_sq:
+                    c += 1
+            counts[i + 1] = c
+        offsets = np.cumsum(counts)
+        for i in prange(n):
+            k = offsets[i]
+            for j in range(i + 1, n):
+                dx = pos[i, 0] - pos[j, 0]
+                dy = pos[i, 1] - pos[j, 1]
+                d2 = dx * dx + dy * dy
+                if d2 <= comm_range_sq:
+                    out_segs[k, 0, 0] = pos[i, 0]
+                    out_segs[k, 0, 1] = pos[i, 1]
+                    out_segs[k, 1, 0] = pos[j, 0]
+                    out_segs[k, 1, 1] = pos[j, 1]
+                    out_dists[k] = np.sqrt(d2)
+                    k += 1
+        return offsets[n]
+
 
 class PathTracer2D:
     """
     Keeps a fading buffer of route segments (x1,y1)-(x2,y2) for recently delivered DataMsg.
     Older segments fade out; buffer size and TTL are configurable.
+
+    Storage is a ring buffer over preallocated arrays (timestamps + (M, 2, 2)
+    segments), so fading is computed with NumPy instead of per-segment Python.
+    Timestamps are non-decreasing in ring order, which lets the sweeper
+    binary-search the expiry point. They are stored as float32 seconds since
+    the tracer was created (sub-millisecond resolution over hours of runtime).
     """
 
-    def __init__(self, ttl_s: float, max_segments: int):
+    def __init__(
+        self,
+        ttl_s: float,
+        max_segments: int,
+        rgb: Tuple[float, float, float] = (0.2, 0.95, 0.4),
+        peak_alpha: float = 0.9,
+    ):
         self.ttl_s = ttl_s
         self.max_segments = max_segments
-        self.buff: deque[Tuple[float, Tuple[float, float], Tuple[float, float]]] = deque()
-
-    def add_path(self, nodes: List[Any], path_ids: List[int]):
-        now = time.time()
-        for i in range(len(path_ids) - 1):
-            a = nodes[path_ids[i]].pos
-            b = nodes[path_ids[i + 1]].pos
-            self.buff.append((now, (a[0], a[1]), (b[0], b[1])))
-            if len(self.buff) > self.max_segments:
-                self.buff.popleft()
-
-    def sweeper(self):
-        """Remove expired segments."""
-        now = time.time()
-        while self.buff and (now - self.buff[0][0]) > self.ttl_s:
-            self.buff.popleft()
-
-    def segments_and_alphas(self):
-        """Return segments and corresponding alphas based on age (0..1)."""
-        now = time.time()
-        segs = []
-        alphas = []
-        for ts, p1, p2 in self.buff:
-            age = now - ts
-            if age <= self.ttl_s:
-                segs.append((p1, p2))
-                # cosine fade: fresh=1.0 → old=0.0
-                a = 0.5 * (1.0 + math.cos(math.pi * age / self.ttl_s))
-                alphas.append(max(0.0, min(1.0, a)))
-        return segs, alphas
+        self.rgb = rgb  # neon green
+        self.peak_alpha = peak_alpha  # alpha of a fresh segment
+        self._t0 = time.monotonic()
+        self._ts = np.empty(max_segments, dtype=np.float32)
+        self._segs = np.empty((max_segments, 2, 2), dtype=np.float64)
+        # RGB is constant, so per frame only the alpha column is rewritten
+        self._rgba = np.empty((max_segments, 4), dtype=np.float64)
+        self._rgba[:, :3] = rgb
+        self._head = 0   # index of the oldest segment
+        self._count = 0
+        # add_path runs on the simulation thread; sweeper/readers on the GUI thread
+        self._lock = threading.Lock()
+
+    def add_path(self, nodes: List[Any], path_ids: Tuple[int, ...]):
+        now = time.monotonic() - self._t0
+        pts = [nodes[nid].pos for nid in path_ids]
+        new = [((a[0], a[1]), (b[0], b[1])) for a, b in zip(pts, pts[1:])]
+        if not new:
+            return
+        M = self.max_segments
+        new = new[-M:]
+        k = len(new)
+        with self._lock:
+            idx = (self._head + self._count + np.arange(k)) % M
+            self._ts[idx] = now
+            self._segs[idx] = new
+            overflow = max(0, self._count + k - M)
+            self._head = (self._head + overflow) % M
+            self._count = min(M, self._count + k)
+
+    def clear(self):
+        with self._lock:
+            self._head = 0
+            self._count = 0
+
+    def _ordered(self, arr: np.ndarray) -> np.ndarray:
+        """Copy of the live part of arr, oldest first (at most two slices)."""
+        M = self.max_segments
+        end = self._head + self._count
+        if end <= M:
+            return arr[self._head:end].copy()
+        return np.concatenate((arr[self._head:], arr[:end - M]))
+
+    def sweeper(self, now: Optional[float] = None):
+        """Remove expired segments. `now` is a time.monotonic() reading (defaults to the current one)."""
+        if now is None:
+            now = time.monotonic()
+        cutoff = now - self._t0 - self.ttl_s
+        M = self.max_segments
+        with self._lock:
+            head, end = self._head, self._head + self._count
+            first = self._ts[head:min(end, M)]
+            n = int(np.searchsorted(first, cutoff))
+            if n == len(first) and end > M:
+                n += int(np.searchsorted(self._ts[:end - M], cutoff))
+            self._head = (head + n) % M
+            self._count -= n
+
+    def segments_and_alphas(self, now: Optional[float] = None):
+        """
+        Return live segments (K, 2, 2) and their RGBA colors (K, 4), with the
+        alpha channel faded by age (cosine: fresh=peak_alpha → old=0.0).
+        The colors are a view into a buffer that the next call overwrites.
+        """
+        if now is None:
+            now = time.monotonic()
+        with self._lock:
+            ts = self._ordered(self._ts)
+            segs = self._ordered(self._segs)
+        ages = (now - self._t0) - ts
+        mask = ages <= self.ttl_s
+        alphas = 0.5 * (1.0 + np.cos(np.pi * ages[mask] / self.ttl_s))
+        colors = self._rgba[:len(alphas)]
+        np.clip(alphas * self.peak_alpha, 0.0, 1.0, out=colors[:, 3])
+        return segs[mask], colors
 
 
 class LiveArtist2D:
@@ -78,7 +177,11 @@ class LiveArtist2D:
             # Create grid: main plot on left, routing tables on right
             gs = self.fig.add_gridspec(1, 2, width_ratios=[2, 1], wspace=0.3)
             self.ax = self.fig.add_subplot(gs[0])
-            self.ax_rt = self.fig.add_subplot(gs[1])
+            # The tables grow with the node count and run below the grid cell; blitting
+            # only refreshes an axes' bbox, so the panel axes reaches down to the
+            # figure bottom (same column and top edge as gs[1])
+            rt_box = gs[1].get_position(self.fig)
+            self.ax_rt = self.fig.add_axes([rt_box.x0, 0.0, rt_box.width, rt_box.y1])
             self.ax_rt.axis('off')
         else:
             self.fig, self.ax = plt.subplots(figsize=(11, 7))
@@ -94,17 +197,32 @@ class LiveArtist2D:
         cmap_nodes = cm.get_cmap("tab20", self.sim.cfg["num_nodes"])
         self.node_colors = [cmap_nodes(i % cmap_nodes.N) for i in range(self.sim.cfg["num_nodes"])]
 
+        # Node positions as one (N, 2) array, refreshed in place every frame
+        self._pos = np.empty((len(self.sim.nodes), 2), dtype=np.float64)
+        self._refresh_positions()
+
         # Initial scatter & labels
-        xs = [n.pos[0] for n in self.sim.nodes]
-        ys = [n.pos[1] for n in self.sim.nodes]
-        self.scatter = self.ax.scatter(xs, ys, s=self.sim.cfg["node_size"], c=self.node_colors)
-        off = self.sim.cfg["label_offset"]
+        self.scatter = self.ax.scatter(
+            self._pos[:, 0], self._pos[:, 1], s=self.sim.cfg["node_size"], c=self.node_colors
+        )
+        # Per-frame constants, read from cfg once
+        self._label_offset = self.sim.cfg["label_offset"]
+        self._dv_off = self._label_offset + 14.0  # DV labels sit slightly further down
+        self._comm_range = self.sim.cfg["comm_range"]
+        self._comm_range_sq = self._comm_range ** 2
+        # Label offsets as (dx, dy) rows so whole position arrays shift in one add
+        self._id_shift = np.array([0.0, self._label_offset])
+        self._dv_shift = np.array([0.0, self._dv_off])
+
+        off = self._label_offset
+        # Labels are clipped to the axes: blitting never repaints outside ax.bbox
         self.labels = [self.ax.text(n.pos[0], n.pos[1] + off, str(n.nid),
-                                    ha="center", va="bottom", fontsize=10) for n in self.sim.nodes]
+                                    ha="center", va="bottom", fontsize=10, clip_on=True)
+                       for n in self.sim.nodes]
 
         # DV cost labels (numbers) under each node
         self.dv_labels = []
-        dv_off = self.sim.cfg["label_offset"] + 14.0  # slightly further down
+        dv_off = self._dv_off
         for n in self.sim.nodes:
             txt = self.ax.text(
                 n.pos[0],
@@ -114,32 +232,58 @@ class LiveArtist2D:
                 va="top",
                 fontsize=9,
                 color="white",
+                clip_on=True,
             )
             self.dv_labels.append(txt)
 
         # Track DV cost changes for highlighting
-        self.prev_costs: Dict[int, Optional[float]] = {n.nid: None for n in self.sim.nodes}
-        self.dv_last_change_ts: Dict[int, float] = {n.nid: 0.0 for n in self.sim.nodes}
+        # (dense per-node arrays; node IDs are the contiguous indices 0..N-1)
+        n_nodes = len(self.sim.nodes)
+        self._cost_vec = np.full(n_nodes, np.nan)
+        self._prev_costs = np.full(n_nodes, np.nan)  # NaN = no route
+        self._dv_last_change = np.full(n_nodes, -np.inf)
         self.dv_highlight_duration = 1.0  # seconds to keep label highlighted
 
+        # Last state pushed to each label; setters are skipped when it hasn't changed
+        # (every Text.set_* invalidates matplotlib's layout cache for that text)
+        self._dv_text_cache: List[str] = ["∞"] * n_nodes
+        self._dv_color_state: List[str] = ["white"] * n_nodes
+        # Formatted cost strings; DV costs take only a handful of distinct values
+        self._cost_str_cache: Dict[float, str] = {}
+        self._label_xy = self._pos.copy()  # node position the labels were last placed at
+        self._label_move_eps = 0.05  # meters
+
         # Neighbor links with color by distance
-        segs, dists = self._edges_with_dists(self.sim.nodes, self.sim.cfg["comm_range"])
-        self.edge_norm = mcolors.Normalize(vmin=0, vmax=self.sim.cfg["comm_range"])
+        # (upper-triangle pair indices are fixed for a given node count; large swarms
+        # use the Numba kernel with worst-case output buffers instead)
+        self._edge_out = None
+        if njit is not None and n_nodes >= NUMBA_MIN_NODES:
+            m_max = n_nodes * (n_nodes - 1) // 2
+            self._edge_out = (np.empty((m_max, 2, 2), dtype=np.float64), np.empty(m_max, dtype=np.float64))
+        else:
+            self._iu, self._ju = np.triu_indices(n_nodes, k=1)
+        segs, dists = self._edges_with_dists(self._pos, self._comm_range_sq)
         self.edge_cmap = cm.plasma
+        # 256-entry RGBA table over [0, comm_range]; frames index into it directly
+        self._edge_lut = self.edge_cmap(np.linspace(0.0, 1.0, 256))
+        self._edge_lut_scale = 255.0 / self._comm_range
         self.lines = LineCollection(
             segs,
             linewidths=2.0,
             alpha=0.75,
-            colors=self.edge_cmap(self.edge_norm(dists)),
+            colors=self._edge_colors(dists),
         )
         self.ax.add_collection(self.lines)
+        self._edge_pos = self._pos.copy()  # positions the current links were computed from
+        self._edge_move_eps = 0.5  # meters
 
         # Route trace layer (fading, thin dotted) for DataMsg deliveries
         self.tracer = PathTracer2D(
             ttl_s=self.sim.cfg["trace_ttl_s"],
             max_segments=self.sim.cfg["trace_max_segments"],
         )
-        self.trace_lines = LineCollection([], linewidths=1.0, alpha=0.9, colors=(0.2, 0.95, 0.4, 0.9))
+        # No collection-level alpha: it would override the per-segment fade in the RGBA colors
+        self.trace_lines = LineCollection([], linewidths=1.0, colors=(0.2, 0.95, 0.4, 0.9))
         self.trace_lines.set_linestyle("dotted")
         self.ax.add_collection(self.trace_lines)
 
@@ -147,14 +291,16 @@ class LiveArtist2D:
         for n in self.sim.nodes:
             n._trace_sink = lambda path_ids, self=self: self.tracer.add_path(self.sim.nodes, path_ids)
 
-        # HUD (slightly lower so it doesn't overlap dv_note)
-        self.hud = self.fig.text(
+        # HUD, inside the main axes (top-left) so blitting covers it
+        self.hud = self.ax.text(
             0.01,
-            0.965,
+            0.99,
             "",
             ha="left",
             va="top",
-            fontsize=11,
+            fontsize=9,
+            transform=self.ax.transAxes,
+            bbox=dict(boxstyle="round,pad=0.3", facecolor="black", alpha=0.35, edgecolor="none"),
         )
         # DV note at the very top center
         self.dv_note = self.fig.text(
@@ -167,8 +313,10 @@ class LiveArtist2D:
             fontsize=9,
         )
 
-        # Routing table text objects
+        # Routing table text objects (refreshed ~3 times per second, not every frame)
         self.rt_text = None
+        self._rt_frame = 0
+        self._rt_update_every = max(1, int(self.sim.cfg["fps"]) // 3)
         if self.show_rt:
             self.rt_text = self.ax_rt.text(
                 0.05, 0.95, "", 
@@ -194,18 +342,40 @@ class LiveArtist2D:
         # Keyboard shortcuts too
         self.fig.canvas.mpl_connect("key_press_event", self._on_key)
 
+        # Everything update() touches; blitting redraws only these over a cached background.
+        # Without mobility the markers, ID labels and links never change, so they stay
+        # out of the blit set and are drawn once into that background.
+        self._static_layout = max(self.sim.cfg["speed_mps"]) <= 0.0
+        if self._static_layout:
+            self._artists = [self.trace_lines, *self.dv_labels, self.hud]
+        else:
+            self._artists = [self.scatter, self.lines, self.trace_lines, *self.labels, *self.dv_labels, self.hud]
+        if self.rt_text is not None:
+            self._artists.append(self.rt_text)
+        for artist in self._artists:
+            artist.set_animated(True)
+
         # Animation
-        interval_ms = int(1000 / self.sim.cfg["fps"])
-        self.anim = FuncAnimation(self.fig, self.update, interval=interval_ms, blit=False)
+        self._interval_ms = int(1000 / self.sim.cfg["fps"])
+        self._paused_interval_ms = max(200, self._interval_ms)
+        self.anim = FuncAnimation(
+            self.fig, self.update, init_func=self._init_artists, interval=self._interval_ms, blit=True
+        )
+
+    def _init_artists(self):
+        return self._artists
 
     def _toggle_pause(self, _event=None):
         self.paused = not self.paused
+        # update() draws nothing new while paused, so tick slowly instead of at full fps
+        if self.anim is not None:
+            self.anim.event_source.interval = self._paused_interval_ms if self.paused else self._interval_ms
 
     def _clear_traces(self, _event):
-        self.tracer.buff.clear()
+        self.tracer.clear()
 
-    def _format_routing_tables(self) -> str:
-        """Format routing tables for display."""
+    def _format_routing_tables(self, now: float) -> str:
+        """Format routing tables for display; `now` is the frame's time.monotonic() reading."""
         lines = []
         lines.append("═" * 36)
         lines.append(" ROUTING TABLES")
@@ -228,7 +398,6 @@ class LiveArtist2D:
             else:
                 # Sort by destination ID
                 sorted_entries = sorted(node.rt.items(), key=lambda x: x[0])
-                now = time.time()
                 for dest, route in sorted_entries:
                     age = now - route.updated_at
                     # Highlight recent updates (< 2 seconds)
@@ -258,118 +427,132 @@ class LiveArtist2D:
                 self.dv_dest = (self.dv_dest + 1) % n_nodes
 
             # Reset highlight state so changes for this new dv_dest are visible
-            self.prev_costs = {n.nid: None for n in self.sim.nodes}
-            self.dv_last_change_ts = {n.nid: 0.0 for n in self.sim.nodes}
+            self._prev_costs.fill(np.nan)
+            self._dv_last_change.fill(-np.inf)
+            self._cost_str_cache.clear()
 
             # Update the legend text
             self.dv_note.set_text(
                 f"Number under each node = DV cost to node {self.dv_dest} (∞ = no route yet). "
                 f"Press LEFT/RIGHT to change destination."
             )
+            # dv_note is static (not blitted): request a full redraw
+            self.fig.canvas.draw_idle()
         elif event.key in ("q", "Q", "escape"):
             plt.close(self.fig)
 
-    @staticmethod
-    def _edges_with_dists(nodes: List[Any], comm_range: float):
-        segs = []
-        dists = []
-        for i in range(len(nodes)):
-            xi, yi, _ = nodes[i].pos
-            for j in range(i + 1, len(nodes)):
-                xj, yj, _ = nodes[j].pos
-                dx, dy = xi - xj, yi - yj
-                dist2 = dx * dx + dy * dy
-                if dist2 <= comm_range ** 2:
-                    segs.append(((xi, yi), (xj, yj)))
-                    dists.append(math.sqrt(dist2))
-        return segs, dists
+    def _edges_with_dists(self, pos: np.ndarray, comm_range_sq: float):
+        """
+        In-range node pairs for an (N, 2) position array, vectorized over the
+        upper triangle. Returns (M, 2, 2) segments and (M,) distances.
+        With the Numba kernel these are views into buffers reused every frame.
+        """
+        if self._edge_out is not None:
+            out_segs, out_dists = self._edge_out
+            m = _edge_kernel(pos, comm_range_sq, out_segs, out_dists)
+            return out_segs[:m], out_dists[:m]
+        d = pos[self._iu] - pos[self._ju]
+        dist2 = np.einsum("ij,ij->i", d, d)
+        mask = dist2 <= comm_range_sq
+        i_sel, j_sel = self._iu[mask], self._ju[mask]
+        segs = np.stack((pos[i_sel], pos[j_sel]), axis=1)
+        return segs, np.sqrt(dist2[mask])
+
+    def _edge_colors(self, dists: np.ndarray) -> np.ndarray:
+        """RGBA colors (M, 4) for link distances, looked up in the cached plasma LUT."""
+        idx = np.clip((dists * self._edge_lut_scale).astype(np.int32), 0, 255)
+        return self._edge_lut[idx]
+
+    def _refresh_positions(self):
+        """Copy current node positions into the (N, 2) self._pos array."""
+        nodes = self.sim.nodes
+        self._pos[:, 0] = [n.pos[0] for n in nodes]
+        self._pos[:, 1] = [n.pos[1] for n in nodes]
 
     def update(self, _frame):
         # even if paused, return artists so FuncAnimation keeps running
         if not self.paused:
-            xs = [n.pos[0] for n in self.sim.nodes]
-            ys = [n.pos[1] for n in self.sim.nodes]
-            self.scatter.set_offsets(list(zip(xs, ys)))
-
-            # Update node ID labels above nodes
-            for lbl, x, y in zip(self.labels, xs, ys):
-                lbl.set_position((x, y + self.sim.cfg["label_offset"]))
-
-            # Update DV cost labels (cost to dv_dest) with highlighting on change
-            dv_off = self.sim.cfg["label_offset"] + 14.0
-            now = time.time()
-            for node, dv_lbl, x, y in zip(self.sim.nodes, self.dv_labels, xs, ys):
-                route = node.rt.get(self.dv_dest)
+            now = time.monotonic()  # one clock read shared by the whole frame
+            if not self._static_layout:
+                self._refresh_positions()
+
+            # Markers and labels are touched only for nodes that actually moved
+            moved = np.flatnonzero(np.abs(self._pos - self._label_xy).max(axis=1) > self._label_move_eps)
+            if len(moved):
+                self.scatter.set_offsets(self._pos)  # (N, 2) float64, no per-point tuples
+                pos = self._pos[moved]
+                id_xy = (pos + self._id_shift).tolist()
+                dv_xy = (pos - self._dv_shift).tolist()
+                for i, id_p, dv_p in zip(moved.tolist(), id_xy, dv_xy):
+                    self.labels[i].set_position(id_p)
+                    self.dv_labels[i].set_position(dv_p)
+                self._label_xy[moved] = pos
+
+            # DV cost to dv_dest for every node (NaN = no route); change detection is vectorized
+            dest = self.dv_dest
+            routes = [node.rt.get(dest) for node in self.sim.nodes]
+            cost_vec = self._cost_vec
+            cost_vec[:] = [np.nan if r is None else r.cost for r in routes]
+            changed = ~np.isclose(cost_vec, self._prev_costs, rtol=0.0, atol=1e-6, equal_nan=True)
+            self._prev_costs[changed] = cost_vec[changed]
+            self._dv_last_change[changed] = now
+            # Highlight labels briefly if they changed recently
+            highlight = (now - self._dv_last_change) < self.dv_highlight_duration
+
+            cost_str = self._cost_str_cache
+            for i, (dv_lbl, route, hl) in enumerate(zip(self.dv_labels, routes, highlight.tolist())):
+                # Restyle only on highlight transitions
+                color = "yellow" if hl else "white"
+                if color != self._dv_color_state[i]:
+                    self._dv_color_state[i] = color
+                    dv_lbl.set_color(color)
+                    dv_lbl.set_fontweight("bold" if hl else "normal")
+
                 if route is None:
-                    cost_val = None
                     txt = "∞"
                 else:
-                    cost_val = route.cost
-                    txt = f"{route.cost:.1f}"
-
-                # Detect changes
-                prev = self.prev_costs[node.nid]
-                if (
-                    (prev is None and cost_val is not None)
-                    or (prev is not None and cost_val is None)
-                    or (prev is not None and cost_val is not None and abs(prev - cost_val) > 1e-6)
-                ):
-                    self.prev_costs[node.nid] = cost_val
-                    self.dv_last_change_ts[node.nid] = now
-
-                # Highlight label briefly if it changed recently
-                age = now - self.dv_last_change_ts[node.nid]
-                if age < self.dv_highlight_duration:
-                    dv_lbl.set_color("yellow")
-                    dv_lbl.set_fontweight("bold")
-                else:
-                    dv_lbl.set_color("white")
-                    dv_lbl.set_fontweight("normal")
-
-                dv_lbl.set_text(txt)
-                dv_lbl.set_position((x, y - dv_off))
-
-            # Neighbor links
-            segs, dists = self._edges_with_dists(self.sim.nodes, self.sim.cfg["comm_range"])
-            self.lines.set_segments(segs)
-            if dists:
-                self.lines.set_color(self.edge_cmap(self.edge_norm(dists)))
+                    txt = cost_str.get(route.cost)
+                    if txt is None:
+                        txt = cost_str[route.cost] = f"{route.cost:.1f}"
+                if txt != self._dv_text_cache[i]:
+                    self._dv_text_cache[i] = txt
+                    dv_lbl.set_text(txt)
+
+            # Neighbor links, rebuilt only once some node moved noticeably since the last scan
+            if np.abs(self._pos - self._edge_pos).max(initial=0.0) >= self._edge_move_eps:
+                self._edge_pos[:] = self._pos
+                segs, dists = self._edges_with_dists(self._pos, self._comm_range_sq)
+                self.lines.set_segments(segs)
+                # Colors are already float RGBA arrays; set_edgecolor skips set_color's face/edge fan-out
+                if len(dists):
+                    self.lines.set_edgecolor(self._edge_colors(dists))
 
             # Sweep + draw route traces (fade)
-            self.tracer.sweeper()
-            segs_fade, alphas = self.tracer.segments_and_alphas()
-            colors = []
-            base = (0.2, 0.95, 0.4)  # neon green
-            for a in alphas:
-                colors.append((base[0], base[1], base[2], a))
+            self.tracer.sweeper(now)
+            segs_fade, colors = self.tracer.segments_and_alphas(now)
             self.trace_lines.set_segments(segs_fade)
-            if colors:
-                self.trace_lines.set_color(colors)
+            if len(colors):
+                self.trace_lines.set_edgecolor(colors)
 
             # HUD stats (Data only)
-            tot_gen = sum(n.generated for n in self.sim.nodes)
-            tot_del = sum(n.delivered for n in self.sim.nodes)
+            tot_gen, tot_del, hop_sum, lat_sum = self.sim.totals()
             dr = (tot_del / tot_gen) if tot_gen else 0.0
-            all_hops = [h for n in self.sim.nodes for h in n.hops_used]
-            avg_hops = (sum(all_hops) / len(all_hops)) if all_hops else 0.0
-            all_lat = [l for n in self.sim.nodes for l in n.latencies]
-            avg_lat = (sum(all_lat) / len(all_lat)) if all_lat else 0.0
+            avg_hops = (hop_sum / tot_del) if tot_del else 0.0
+            avg_lat = (lat_sum / tot_del) if tot_del else 0.0
 
             self.hud.set_text(
-                f"Nodes: {len(self.sim.nodes)}   Range: {self.sim.cfg['comm_range']} m   "
-                f"Generated (Data): {tot_gen}   Delivered: {tot_del}   DR: {dr:.2f}   "
+                f"Nodes: {len(self.sim.nodes)}   Range: {self._comm_range} m   "
+                f"Generated (Data): {tot_gen}   Delivered: {tot_del}   DR: {dr:.2f}\n"
                 f"Avg hops: {avg_hops:.2f}   Avg latency: {avg_lat:.3f}s"
             )
 
             # Update routing tables display
             if self.show_rt and self.rt_text is not None:
-                rt_str = self._format_routing_tables()
-                self.rt_text.set_text(rt_str)
+                if self._rt_frame % self._rt_update_every == 0:
+                    self.rt_text.set_text(self._format_routing_tables(now))
+                self._rt_frame += 1
 
-        artists = [self.scatter, self.lines, self.trace_lines, *self.labels, *self.dv_labels, self.hud]
-        if self.rt_text is not None:
-            artists.append(self.rt_text)
-        return artists
+        return self._artists
 
 
 def run_live_viz(sim: Simulation):